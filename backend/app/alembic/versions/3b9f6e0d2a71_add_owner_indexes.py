@@ -0,0 +1,29 @@
+"""add owner indexes
+
+Revision ID: 3b9f6e0d2a71
+Revises: e7a4c2d91b58
+Create Date: 2026-10-16 16:48:09.331762
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9f6e0d2a71'
+down_revision = 'e7a4c2d91b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_quiz_owner_id_id', 'quiz', ['owner_id', 'id'], unique=False
+    )
+    op.create_index(op.f('ix_item_owner_id'), 'item', ['owner_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_item_owner_id'), table_name='item')
+    op.drop_index('ix_quiz_owner_id_id', table_name='quiz')
@@ -0,0 +1,31 @@
+"""add quizexercise position index
+
+Revision ID: 5d7e1b38c2fa
+Revises: c41e7b0a9f25
+Create Date: 2026-10-16 14:02:36.518274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7e1b38c2fa'
+down_revision = 'c41e7b0a9f25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_quizexercise_quiz_id_position',
+        'quizexercise',
+        ['quiz_id', 'position'],
+        unique=False,
+        postgresql_include=['exercise_id', 'is_correct'],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_quizexercise_quiz_id_position', table_name='quizexercise')
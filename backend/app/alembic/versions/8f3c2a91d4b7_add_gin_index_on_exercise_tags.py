@@ -0,0 +1,32 @@
+"""add gin index on exercise tags
+
+Revision ID: 8f3c2a91d4b7
+Revises: 462bcdf46acc
+Create Date: 2026-10-16 12:05:11.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '8f3c2a91d4b7'
+down_revision = '462bcdf46acc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # default jsonb_ops class, jsonb_path_ops doesn't support ? / ?| operators
+    op.create_index(
+        'ix_exercise_tags',
+        'exercise',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('ix_exercise_tags', table_name='exercise')
@@ -0,0 +1,57 @@
+"""exercise answers and illustration text arrays
+
+Revision ID: 9c1d5a7e3f24
+Revises: 3b9f6e0d2a71
+Create Date: 2026-10-16 17:31:52.074618
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1d5a7e3f24'
+down_revision = '3b9f6e0d2a71'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = ('answers', 'illustration')
+
+
+def upgrade():
+    # same copy through a new column as for tags, USING can't unpack jsonb arrays.
+    # WITH ORDINALITY keeps the element order, answers are matched by position
+    for name in COLUMNS:
+        op.add_column(
+            'exercise',
+            sa.Column(f'{name}_array', postgresql.ARRAY(sa.String()), nullable=True),
+        )
+        op.execute(
+            f"UPDATE exercise SET {name}_array = "
+            f"ARRAY(SELECT e FROM jsonb_array_elements_text({name}) "
+            f"WITH ORDINALITY AS t(e, i) ORDER BY i) "
+            f"WHERE jsonb_typeof({name}) = 'array'"
+        )
+        op.drop_column('exercise', name)
+        op.alter_column('exercise', f'{name}_array', new_column_name=name)
+
+
+def downgrade():
+    for name in COLUMNS:
+        op.add_column(
+            'exercise',
+            sa.Column(
+                f'{name}_jsonb', postgresql.JSONB(astext_type=sa.Text()), nullable=True
+            ),
+        )
+        op.execute(
+            f"UPDATE exercise SET {name}_jsonb = ("
+            f"SELECT coalesce(jsonb_agg(e ORDER BY i), '[]'::jsonb) "
+            f"FROM unnest({name}) WITH ORDINALITY AS t(e, i)) "
+            f"WHERE {name} IS NOT NULL"
+        )
+        op.drop_column('exercise', name)
+        op.alter_column('exercise', f'{name}_jsonb', new_column_name=name)
@@ -0,0 +1,67 @@
+"""quiz status enum
+
+Revision ID: a62f9d0e4c13
+Revises: 5d7e1b38c2fa
+Create Date: 2026-10-16 14:40:12.903516
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a62f9d0e4c13'
+down_revision = '5d7e1b38c2fa'
+branch_labels = None
+depends_on = None
+
+
+quiz_status = postgresql.ENUM(
+    'new', 'in_progress', 'active', 'submitted', 'graded', name='quiz_status'
+)
+
+
+def upgrade():
+    quiz_status.create(op.get_bind(), checkfirst=True)
+    op.execute("ALTER TABLE quiz DROP CONSTRAINT IF EXISTS valid_quiz_status")
+    # partial index predicate compares status, rebuilt around the type change
+    op.drop_index('idx_active_quiz_per_user', table_name='quiz')
+    op.alter_column(
+        'quiz',
+        'status',
+        existing_type=sa.String(),
+        type_=quiz_status,
+        postgresql_using='status::quiz_status',
+        server_default='new',
+        existing_nullable=False,
+    )
+    op.create_index(
+        'idx_active_quiz_per_user',
+        'quiz',
+        ['owner_id'],
+        unique=True,
+        postgresql_where=sa.sql.text("status = 'active'"),
+    )
+
+
+def downgrade():
+    op.drop_index('idx_active_quiz_per_user', table_name='quiz')
+    op.alter_column(
+        'quiz',
+        'status',
+        existing_type=quiz_status,
+        type_=sa.String(),
+        postgresql_using='status::text',
+        server_default=None,
+        existing_nullable=False,
+    )
+    op.create_index(
+        'idx_active_quiz_per_user',
+        'quiz',
+        ['owner_id'],
+        unique=True,
+        postgresql_where=sa.sql.text("status = 'active'"),
+    )
+    quiz_status.drop(op.get_bind(), checkfirst=True)
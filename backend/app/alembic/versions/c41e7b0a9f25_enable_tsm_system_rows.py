@@ -0,0 +1,26 @@
+"""enable tsm_system_rows
+
+Revision ID: c41e7b0a9f25
+Revises: 8f3c2a91d4b7
+Create Date: 2026-10-16 12:31:47.209144
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e7b0a9f25'
+down_revision = '8f3c2a91d4b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # TABLESAMPLE SYSTEM_ROWS used for random exercise selection
+    op.execute("CREATE EXTENSION IF NOT EXISTS tsm_system_rows")
+
+
+def downgrade():
+    op.execute("DROP EXTENSION IF EXISTS tsm_system_rows")
@@ -0,0 +1,63 @@
+"""exercise tags text array
+
+Revision ID: e7a4c2d91b58
+Revises: a62f9d0e4c13
+Create Date: 2026-10-16 16:02:37.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a4c2d91b58'
+down_revision = 'a62f9d0e4c13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # USING can't hold the subquery that unpacks a jsonb array, so the values
+    # are copied through a new column, in their original order
+    op.add_column(
+        'exercise',
+        sa.Column('tags_array', postgresql.ARRAY(sa.String()), nullable=True),
+    )
+    op.execute(
+        "UPDATE exercise "
+        "SET tags_array = ARRAY("
+        "SELECT tag FROM jsonb_array_elements_text(tags) WITH ORDINALITY AS t(tag, i) "
+        "ORDER BY i) "
+        "WHERE tags IS NOT NULL"
+    )
+    op.drop_index('ix_exercise_tags', table_name='exercise')
+    op.drop_column('exercise', 'tags')
+    op.alter_column('exercise', 'tags_array', new_column_name='tags')
+    op.create_index(
+        'ix_exercise_tags',
+        'exercise',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('ix_exercise_tags', table_name='exercise')
+    op.alter_column(
+        'exercise',
+        'tags',
+        existing_type=postgresql.ARRAY(sa.String()),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='to_jsonb(tags)',
+        existing_nullable=True,
+    )
+    op.create_index(
+        'ix_exercise_tags',
+        'exercise',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin',
+    )
@@ -10,7 +10,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import security
 from app.core.config import settings
-from app.core.db import async_engine
+from app.core.db import async_session_maker
 from app.models import TokenPayload, User
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -19,7 +19,7 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None, None]:
-    async with AsyncSession(async_engine) as session:
+    async with async_session_maker() as session:
         async with session.begin():
             yield session
 
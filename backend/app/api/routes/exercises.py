@@ -1,4 +1,3 @@
-from uuid_extensions import uuid7str
 from typing import Any
 from fastapi import APIRouter, HTTPException
 from sqlmodel import func, select
@@ -22,15 +21,32 @@ async def read_exercises(session: SessionDep, skip: int = 0, limit: int = 100) -
     Retrieve exercises.
     """
 
-    count_statement = select(func.count()).select_from(Exercise)
-    count = (await session.exec(count_statement)).one()
-    statement = select(Exercise).offset(skip).limit(limit).order_by(Exercise.id)
+    # only the public columns, the solution never leaves the database. The total
+    # rides along with the page as a window count, one round-trip
+    statement = (
+        select(
+            Exercise.id,
+            Exercise.source_name,
+            Exercise.source_id,
+            Exercise.text,
+            Exercise.answers,
+            Exercise.illustration,
+            Exercise.tags,
+            func.count().over().label("total"),
+        )
+        .offset(skip)
+        .limit(limit)
+        .order_by(Exercise.id)
+    )
     exercises = (await session.exec(statement)).all()
-    public_list = []
-    for exercise in exercises:
-        exercise_data = ExercisePublic.model_validate(exercise)
-        public_list.append(exercise_data)
-    return ExercisesPublic(data=public_list, count=count)
+    if exercises:
+        count = exercises[0].total
+    else:
+        # a page past the end has no row to carry the total
+        count_statement = select(func.count()).select_from(Exercise)
+        count = (await session.exec(count_statement)).one()
+    # plain envelope, FastAPI validates the rows once against response_model
+    return {"data": exercises, "count": count}
 
 
 @router.get("/{id}", response_model=ExercisePublic)
@@ -43,8 +59,7 @@ async def read_exercise(session: SessionDep, id: str) -> Any:
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
 
-    response = ExercisePublic.model_validate(exercise)
-    return response
+    return exercise
 
 
 @router.post("/", response_model=ExercisePublic)
@@ -61,10 +76,8 @@ async def create_exercise(
     exercise = Exercise.model_validate(exercise_in)
     session.add(exercise)
     await session.flush()
-    await session.refresh(exercise)
 
-    response = ExercisePublic.model_validate(exercise)
-    return response
+    return exercise
 
 
 @router.put("/{id}", response_model=ExercisePublic)
@@ -92,10 +105,8 @@ async def update_exercise(
     exercise.sqlmodel_update(exercise_data)
     session.add(exercise)
     await session.flush()
-    await session.refresh(exercise)
 
-    response = ExercisePublic.model_validate(exercise)
-    return response
+    return exercise
 
 
 @router.delete("/{id}")
@@ -4,8 +4,10 @@ Quizzes only accessable by the owner
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.routing import PydanticCoreRoute
 from app.core.quiz import (
     get_quiz_by_id,
     get_all_quizzes_by_owner,
@@ -30,7 +32,10 @@ from app.models import (
     User,
 )
 
-router = APIRouter(prefix="/users/{user_id}/quizzes", tags=["quizzes"])
+# quiz payloads carry the longest bodies, parsed by pydantic-core
+router = APIRouter(
+    prefix="/users/{user_id}/quizzes", tags=["quizzes"], route_class=PydanticCoreRoute
+)
 
 
 @router.get("/", response_model=QuizzesPublic)
@@ -46,9 +51,13 @@ async def read_quizzes_route(
     """
     user = await session.get(User, user_id)
     if user == current_user:
-        quiz_list = await get_all_quizzes_by_owner(owner_id=user_id, session=session)
-        count = len(quiz_list)
-        quizzes = quiz_list[skip : skip + limit]
+        count_statement = (
+            select(func.count()).select_from(Quiz).where(Quiz.owner_id == user_id)
+        )
+        count = (await session.exec(count_statement)).one()
+        quizzes = await get_all_quizzes_by_owner(
+            owner_id=user_id, session=session, skip=skip, limit=limit
+        )
         return QuizzesPublic(data=quizzes, count=count)
 
     else:
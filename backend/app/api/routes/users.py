@@ -1,4 +1,3 @@
-from uuid_extensions import uuid7str
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -39,13 +38,30 @@ async def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> An
     Retrieve users.
     """
 
-    count_statement = select(func.count()).select_from(User)
-    count = (await session.exec(count_statement)).one()
-
-    statement = select(User).offset(skip).limit(limit)
+    # only the public columns, password hashes stay in the database. The total
+    # rides along with the page as a window count, one round-trip
+    statement = (
+        select(
+            User.id,
+            User.email,
+            User.is_active,
+            User.is_superuser,
+            User.full_name,
+            func.count().over().label("total"),
+        )
+        .offset(skip)
+        .limit(limit)
+    )
     users = (await session.exec(statement)).all()
+    if users:
+        count = users[0].total
+    else:
+        # a page past the end has no row to carry the total
+        count_statement = select(func.count()).select_from(User)
+        count = (await session.exec(count_statement)).one()
 
-    return UsersPublic(data=users, count=count)
+    # plain envelope, FastAPI validates the rows once against response_model
+    return {"data": users, "count": count}
 
 
 @router.post(
@@ -95,7 +111,6 @@ async def update_user_me(
     current_user.sqlmodel_update(user_data)
     session.add(current_user)
     await session.commit()
-    await session.refresh(current_user)
     return current_user
 
 
@@ -0,0 +1,79 @@
+import json
+import re
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic_core import from_json, to_json
+
+# pydantic-core ends its parse errors with the 1-based line and column it stopped at
+_ERROR_LOCATION = re.compile(r" at line (\d+) column (\d+)$")
+
+
+def _json_decode_error(error: ValueError, body: bytes) -> json.JSONDecodeError:
+    """Rebuild a pydantic-core parse error as the JSONDecodeError json.loads raises.
+
+    :param error: The ValueError raised by pydantic_core.from_json.
+    :param body: The request body that failed to parse.
+    :return: A JSONDecodeError pointing at the character the parser stopped at.
+    """
+    message = str(error)
+    doc = body.decode(errors="replace")
+    match = _ERROR_LOCATION.search(message)
+    if match is None:
+        return json.JSONDecodeError(message, doc, 0)
+    if message.startswith("EOF"):
+        # reported at the last character read, json.loads points past it
+        return json.JSONDecodeError(message[: match.start()], doc, len(doc))
+
+    line, column = int(match[1]), int(match[2])
+    line_start = 0
+    for _ in range(line - 1):
+        line_start = body.find(b"\n", line_start) + 1
+    # the column counts bytes, JSONDecodeError wants a character offset
+    offset = line_start + max(column - 1, 0)
+    position = len(body[:offset].decode(errors="replace"))
+    return json.JSONDecodeError(message[: match.start()], doc, position)
+
+
+class PydanticCoreJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core's Rust encoder instead of json.dumps."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class PydanticCoreRequest(Request):
+    """Request parsing its JSON body with pydantic-core's Rust parser.
+
+    Replaces json.loads for endpoints routed through PydanticCoreRoute.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            try:
+                self._json = from_json(body)
+            except ValueError as e:
+                # FastAPI turns JSONDecodeError into a 422, anything else into a 400
+                raise _json_decode_error(e, body) from e
+        return self._json
+
+
+class PydanticCoreRoute(APIRoute):
+    """Route handing its endpoint a PydanticCoreRequest.
+
+    Request bodies are parsed by pydantic-core and skip the json module.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def pydantic_core_route_handler(request: Request) -> Response:
+            return await route_handler(
+                PydanticCoreRequest(request.scope, request.receive)
+            )
+
+        return pydantic_core_route_handler
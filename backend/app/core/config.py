@@ -28,6 +28,8 @@ class Settings(BaseSettings):
         # Use top level .env file (one level above ./backend/)
         env_file="../.env",
         env_ignore_empty=True,
+        # lets optional settings be switched off from the environment with "null"
+        env_parse_none_str="null",
         extra="ignore",
     )
     API_V1_STR: str = "/api/v1"
@@ -55,6 +57,18 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # connection pool per worker process, each worker may open up to
+    # POOL_SIZE + MAX_OVERFLOW connections. Keep workers * (10 + 10) below the
+    # server's max_connections (100 by default), the Dockerfile runs 4 workers
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_QUERY_CACHE_SIZE: int = 1200
+    # executions of the same query before psycopg prepares it server-side, 5 is
+    # psycopg's own default. Must be None (POSTGRES_PREPARE_THRESHOLD=null) behind a
+    # transaction-mode pooler such as pgbouncer, prepared statements don't survive
+    # the server connection changing between transactions
+    POSTGRES_PREPARE_THRESHOLD: int | None = 5
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,4 +1,4 @@
-from sqlmodel import Session, create_engine, select
+from sqlmodel import select
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -10,9 +10,18 @@ async_engine = create_async_engine(
     str(settings.SQLALCHEMY_DATABASE_URI),
     echo=True,
     future=True,
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+    query_cache_size=settings.POSTGRES_QUERY_CACHE_SIZE,
+    connect_args={"prepare_threshold": settings.POSTGRES_PREPARE_THRESHOLD},
 )
 
-async_session_maker = async_sessionmaker(async_engine, expire_on_commit=False)
+# objects keep their loaded state after commit, so nothing has to be refreshed
+async_session_maker = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
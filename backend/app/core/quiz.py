@@ -1,16 +1,28 @@
 import random
 import logging
+from collections.abc import Iterable
+from operator import attrgetter
+from uuid import UUID
 from uuid_extensions import uuid7str
 from sqlmodel import select, func
-from sqlalchemy import cast, String, or_, update
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    column,
+    delete,
+    insert,
+    inspect,
+    lambda_stmt,
+    String,
+    update,
+    values,
+)
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from pydantic import TypeAdapter
 from sqlmodel.ext.asyncio.session import AsyncSession
-from fastapi import HTTPException
 
 from app.models import (
     Exercise,
-    ExercisePublic,
     Quiz,
     QuizPublic,
     QuizCreate,
@@ -25,6 +37,194 @@ from app.models import (
 
 logger = logging.getLogger(__name__)
 
+# every character str.strip() removes, so solutions are trimmed in SQL by the same
+# rule as answers in Python. No whitespace code point lies above U+3000
+_WHITESPACE = "".join(filter(str.isspace, map(chr, range(0x3001))))
+
+# built once, validating the whole exercise list in one pass instead of per item
+_QUIZ_EXERCISES_ADAPTER = TypeAdapter(list[QuizExerciseDataPublic])
+
+# C-level attribute extraction for quiz links, in place of per-row comprehensions
+_GET_EXERCISE_POSITION = attrgetter("exercise", "position")
+_GET_EXERCISE_ID = attrgetter("exercise_id")
+
+
+def _exercises_to_public(
+    exercise_positions: Iterable[tuple[Exercise, int]],
+) -> list[QuizExerciseDataPublic]:
+    """Convert (exercise, position) pairs into their public representation.
+
+    :param exercise_positions: Exercises paired with their positions in the quiz,
+        consumed once.
+    :return: A list of QuizExerciseDataPublic objects.
+    """
+    # exercises are read from their attributes inside the same validation call
+    return _QUIZ_EXERCISES_ADAPTER.validate_python(
+        [
+            {"exercise": exercise, "position": position}
+            for exercise, position in exercise_positions
+        ],
+        from_attributes=True,
+    )
+
+
+def quiz_to_public(
+    quiz: Quiz,
+    exercise_positions: Iterable[tuple[Exercise, int]] | None = None,
+) -> QuizPublic:
+    """Build the public representation of a quiz.
+
+    :param quiz: The Quiz object to convert.
+    :param exercise_positions: Exercises paired with their positions, taken from
+        quiz.quiz_exercises if omitted.
+    :return: The QuizPublic object.
+    """
+    # a lazy map, the links are read straight into the adapter input in one pass
+    if exercise_positions is None:
+        exercise_positions = map(_GET_EXERCISE_POSITION, quiz.quiz_exercises)
+
+    # row values come from the database and exercises are already validated
+    return QuizPublic.model_construct(
+        id=quiz.id,
+        owner_id=quiz.owner_id,
+        status=quiz.status,
+        exercises=_exercises_to_public(exercise_positions),
+        title=quiz.title,
+    )
+
+
+# Hot statements are built through lambda_stmt, so SQLAlchemy caches the constructed
+# statement by the lambda's code location and only swaps in the bound parameters.
+def _quiz_by_id_statement(quiz_id: str) -> StatementLambdaElement:
+    statement = lambda_stmt(
+        lambda: select(Quiz).options(
+            selectinload(Quiz.quiz_exercises).selectinload(QuizExercise.exercise)
+        )
+    )
+    statement += lambda s: s.where(Quiz.id == quiz_id)
+    return statement
+
+
+def _active_quiz_statement(owner_id: str) -> StatementLambdaElement:
+    active = QuizStatusChoices.ACTIVE.value
+    statement = lambda_stmt(
+        lambda: select(Quiz)
+        .options(selectinload(Quiz.quiz_exercises).selectinload(QuizExercise.exercise))
+        .order_by(Quiz.id)
+    )
+    statement += lambda s: s.where(Quiz.owner_id == owner_id, Quiz.status == active)
+    return statement
+
+
+def _deactivate_quizzes_statement(owner_id: str) -> StatementLambdaElement:
+    active = QuizStatusChoices.ACTIVE.value
+    in_progress = QuizStatusChoices.IN_PROGRESS.value
+    return lambda_stmt(
+        lambda: update(Quiz)
+        .where(Quiz.owner_id == owner_id, Quiz.status == active)
+        .values(status=in_progress)
+    )
+
+
+async def sample_exercises(session: AsyncSession, k: int) -> list[Exercise]:
+    """Pick up to k random exercises without sorting the whole exercise table.
+
+    TABLESAMPLE SYSTEM_ROWS reads a handful of random pages, so the cost depends on k
+    and not on the table size. The sample is oversampled and narrowed down in Python
+    to even out rows clustered on the same pages.
+
+    :param session: The database session.
+    :param k: The number of exercises to pick.
+    :return: A list of at most k randomly chosen Exercise objects.
+    """
+    sample_size = max(k * 3, 50)
+    sampled = aliased(
+        Exercise, Exercise.__table__.tablesample(func.system_rows(sample_size))
+    )
+    candidates = (await session.exec(select(sampled))).all()
+    return random.sample(candidates, min(k, len(candidates)))
+
+
+def _random_id_between(low: str, high: str) -> str:
+    """Draw a random UUID string sorting between two UUID strings, both included.
+
+    :param low: The lowest UUID string the result may take.
+    :param high: The highest UUID string the result may take.
+    :return: A random UUID string in the canonical lowercase form of uuid7str.
+    """
+    return str(UUID(int=random.randint(UUID(low).int, UUID(high).int)))
+
+
+async def sample_tagged_exercises(
+    session: AsyncSession, tags: list[str], k: int
+) -> list[Exercise]:
+    """Pick up to k random exercises matching any of the tags without ORDER BY random().
+
+    A random floor is drawn between the first and last exercise ids, and the matches
+    from the floor on are read in id order, wrapping around to the lowest ids when too
+    few remain. Every probe is bounded by the sample size, TABLESAMPLE doesn't fit
+    here since the sampled pages may hold none of the rows matching rarer tags.
+
+    :param session: The database session.
+    :param tags: Tags of which an exercise has to match at least one.
+    :param k: The number of exercises to pick.
+    :return: A list of at most k randomly chosen Exercise objects.
+    """
+    # min and max are each answered from one end of the primary key index
+    first_id, last_id = (
+        await session.exec(select(func.min(Exercise.id), func.max(Exercise.id)))
+    ).one()
+    if first_id is None:
+        return []
+
+    sample_size = max(k * 3, 50)
+    floor = _random_id_between(first_id, last_id)
+    # && matches any of the tags in a single GIN index probe
+    matches = Exercise.tags.overlap(tags)
+    candidates = list(
+        (
+            await session.exec(
+                select(Exercise)
+                .where(matches, Exercise.id >= floor)
+                .order_by(Exercise.id)
+                .limit(sample_size)
+            )
+        ).all()
+    )
+    if len(candidates) < sample_size:
+        candidates += (
+            await session.exec(
+                select(Exercise)
+                .where(matches, Exercise.id < floor)
+                .order_by(Exercise.id)
+                .limit(sample_size - len(candidates))
+            )
+        ).all()
+    return random.sample(candidates, min(k, len(candidates)))
+
+
+async def insert_quiz_exercises(
+    session: AsyncSession,
+    quiz_id: str,
+    exercise_positions: list[tuple[str, int]],
+) -> None:
+    """Link exercises to a quiz in one batched INSERT, bypassing the unit of work.
+
+    :param session: The database session.
+    :param quiz_id: The ID of the quiz to link the exercises to.
+    :param exercise_positions: Pairs of exercise ID and its position in the quiz.
+    """
+    if not exercise_positions:
+        return
+
+    await session.exec(
+        insert(QuizExercise),
+        params=[
+            {"quiz_id": quiz_id, "exercise_id": exercise_id, "position": position}
+            for exercise_id, position in exercise_positions
+        ],
+    )
+
 
 async def form_quiz(
     length: int,
@@ -32,7 +232,8 @@ async def form_quiz(
     owner_id: str,
     session: AsyncSession,
     title: str | None = None,
-) -> Quiz:
+    status: str = QuizStatusChoices.NEW.value,
+) -> tuple[Quiz, list[tuple[Exercise, int]]]:
     """
     Form a quiz by selecting exercises based on the provided tags and populate a Quiz model.
     If no tags provided, fills it with random exercises.
@@ -42,52 +243,51 @@ async def form_quiz(
     :param owner_id: The ID of the user owning the quiz.
     :param session: The database session.
     :param title: Optional title for the quiz.
-    :return: A Quiz object representing the created quiz.
+    :param status: Status to create the quiz with, "new" by default.
+    :return: A Quiz object representing the created quiz and a list of its exercises
+        paired with their positions, ordered by position.
     """
 
     if length <= 0:
-        return Quiz(owner_id=owner_id, title=title, status="new", exercises=[])
-
-    if tags:
-        statement = (
-            select(Exercise)
-            .where(or_(*[Exercise.tags.op("?")(tag) for tag in tags]))
-            .limit(length)
-        )
+        exercises = []
+    elif tags:
+        exercises = await sample_tagged_exercises(session=session, tags=tags, k=length)
     else:
-        statement = select(Exercise).order_by(func.random()).limit(length)
-
-    exercises = (await session.exec(statement)).all()
+        exercises = await sample_exercises(session=session, k=length)
 
     if len(exercises) < length:
         length = len(exercises)
 
-    positions = list(range(length))
-    random.shuffle(positions)
+    positions = random.sample(range(length), length)
 
+    # id is generated client-side, so links can reference it before the quiz is flushed
     quiz = Quiz(
+        id=uuid7str(),
         owner_id=owner_id,
         title=title,
-        status="new",
+        status=status,
     )
-
     session.add(quiz)
-    await session.flush()
 
     # adding exercises and positions to the quiz using link model
-    for exercise, position in zip(exercises, positions):
-        quiz_exercise = QuizExercise(
-            quiz_id=quiz.id,
-            exercise_id=exercise.id,
-            position=position,
-        )
-
-        session.add(quiz_exercise)
-
+    await insert_quiz_exercises(
+        session=session,
+        quiz_id=quiz.id,
+        exercise_positions=[
+            (exercise.id, position)
+            for exercise, position in zip(exercises, positions, strict=True)
+        ],
+    )
     await session.flush()
-    await session.refresh(quiz, ["exercises"])
 
-    return quiz
+    exercise_positions = sorted(
+        zip(exercises, positions, strict=True), key=lambda pair: pair[1]
+    )
+    # exercises are already in memory, filling the relationship without a reload
+    set_committed_value(
+        quiz, "exercises", [exercise for exercise, _ in exercise_positions]
+    )
+    return quiz, exercise_positions
 
 
 async def deactivate_quizzes(owner_id: str, session: AsyncSession) -> None:
@@ -103,15 +303,36 @@ async def deactivate_quizzes(owner_id: str, session: AsyncSession) -> None:
     :param session: The database session.
     """
 
-    statement = (
-        update(Quiz)
-        .where(Quiz.owner_id == owner_id, Quiz.status == QuizStatusChoices.ACTIVE.value)
-        .values(status=QuizStatusChoices.IN_PROGRESS.value)
-    )
-    await session.exec(statement)
+    await session.exec(_deactivate_quizzes_statement(owner_id))
     await session.flush()
 
 
+async def get_quiz_with_exercises(quiz_id: str, session: AsyncSession) -> Quiz | None:
+    """Retrieve a Quiz with its exercises loaded, from the identity map when possible.
+
+    :param quiz_id: The ID of the quiz to retrieve.
+    :param session: The database session.
+    :return: The Quiz object if found, otherwise None.
+    """
+    options = [selectinload(Quiz.quiz_exercises).selectinload(QuizExercise.exercise)]
+    quiz = await session.get(Quiz, quiz_id, options=options)
+
+    # an identity map hit may hold its links, or their exercises, unloaded and the
+    # async session can't lazy load them, so only then the quiz is selected again
+    if quiz is not None and (
+        "quiz_exercises" in inspect(quiz).unloaded
+        or any("exercise" in inspect(link).unloaded for link in quiz.quiz_exercises)
+    ):
+        quiz = (
+            await session.scalars(
+                _quiz_by_id_statement(quiz_id),
+                execution_options={"populate_existing": True},
+            )
+        ).first()
+
+    return quiz
+
+
 async def get_quiz_by_id(
     quiz_id: str,
     session: AsyncSession,
@@ -122,71 +343,76 @@ async def get_quiz_by_id(
     :param session: The database session.
     :return: The QuizPublic object if found, otherwise None.
     """
-    statement = (
-        select(Quiz)
-        .where(Quiz.id == quiz_id)
-        .options(selectinload(Quiz.quiz_exercises).selectinload(QuizExercise.exercise))
-    )
-    quiz = (await session.exec(statement)).first()
+    quiz = await get_quiz_with_exercises(quiz_id=quiz_id, session=session)
 
     if not quiz:
         return None
 
-    exercises_data = [
-        QuizExerciseDataPublic(
-            exercise=ExercisePublic.model_validate(qe.exercise),
-            position=qe.position,
-        )
-        for qe in quiz.quiz_exercises
-    ]
-
-    response = QuizPublic(
-        id=quiz.id,
-        owner_id=quiz.owner_id,
-        status=quiz.status,
-        exercises=exercises_data,
-        title=quiz.title,
-    )
-    return response
+    return quiz_to_public(quiz)
 
 
 async def get_all_quizzes_by_owner(
     owner_id: str,
     session: AsyncSession,
+    skip: int = 0,
+    limit: int | None = None,
 ) -> list[QuizPublic]:
-    """Retrieve all quizzes for a given owner.
+    """Retrieve quizzes for a given owner, ordered by ID.
 
     :param owner_id: The ID of the user whose quizzes are to be retrieved.
     :param session: The database session.
+    :param skip: Number of quizzes to skip.
+    :param limit: Maximum number of quizzes to return, all of them if None.
     :return: A list of QuizPublic objects.
     """
-    statement = (
-        select(Quiz)
+    # paging on quiz ids, limiting the joined rows would cut quizzes in half
+    quiz_ids = (
+        select(Quiz.id)
         .where(Quiz.owner_id == owner_id)
-        .options(selectinload(Quiz.quiz_exercises).selectinload(QuizExercise.exercise))
         .order_by(Quiz.id)
+        .offset(skip)
+        .limit(limit)
     )
-    request = await session.exec(statement)
-    quizzes = request.all()
-
-    quiz_public_list = []
-    for quiz in quizzes:
-        quiz_public = QuizPublic(
-            id=quiz.id,
-            owner_id=quiz.owner_id,
-            status=quiz.status,
-            exercises=[
-                QuizExerciseDataPublic(
-                    exercise=ExercisePublic.model_validate(qe.exercise),
-                    position=qe.position,
-                )
-                for qe in quiz.quiz_exercises
-            ],
-            title=quiz.title,
+    statement = (
+        select(
+            Quiz.id,
+            Quiz.title,
+            Quiz.status,
+            Quiz.owner_id,
+            Exercise,
+            QuizExercise.position,
         )
-        quiz_public_list.append(quiz_public)
-
-    return quiz_public_list
+        .outerjoin(QuizExercise, QuizExercise.quiz_id == Quiz.id)
+        .outerjoin(Exercise, Exercise.id == QuizExercise.exercise_id)
+        .where(Quiz.id.in_(quiz_ids.scalar_subquery()))
+        .order_by(Quiz.id, QuizExercise.position)
+    )
+    rows = (await session.exec(statement)).all()
+
+    # folding joined rows into one QuizPublic per quiz, quizzes without exercises
+    # come back as a single row with no exercise
+    quizzes: dict[str, tuple[str | None, str, str, list[tuple[Exercise, int]]]] = {}
+    for quiz_id, title, status, quiz_owner_id, exercise, position in rows:
+        if quiz_id not in quizzes:
+            quizzes[quiz_id] = (title, status, quiz_owner_id, [])
+        if exercise is not None:
+            quizzes[quiz_id][3].append((exercise, position))
+
+    return [
+        QuizPublic.model_construct(
+            id=quiz_id,
+            owner_id=quiz_owner_id,
+            status=status,
+            exercises=_exercises_to_public(exercise_positions),
+            title=title,
+        )
+        for quiz_id, (
+            title,
+            status,
+            quiz_owner_id,
+            exercise_positions,
+        ) in quizzes.items()
+    ]
 
 
 async def create_quiz(
@@ -202,53 +428,39 @@ async def create_quiz(
     :raises ValueError: If any exercise IDs are duplicated or not found.
     """
 
-    if quiz_in.exercise_positions:
-        # Detect duplicates
-        seen_ids = set()
-        for ex_pos in quiz_in.exercise_positions:
-            ex_id = ex_pos.exercise.id
-            if ex_id in seen_ids:
-                raise ValueError(f"Duplicate exercise ID in quiz: {ex_id}")
-            seen_ids.add(ex_id)
-
-        # Fetch all exercises in one query
-        exercise_ids = [ex.exercise.id for ex in quiz_in.exercise_positions]
+    # Detect duplicates and build the position map in one pass
+    position_map: dict[str, int] = {}
+    for ex_pos in quiz_in.exercise_positions or []:
+        ex_id = ex_pos.exercise_id
+        if ex_id in position_map:
+            raise ValueError(f"Duplicate exercise ID in quiz: {ex_id}")
+        position_map[ex_id] = ex_pos.position
+
+    if position_map:
+        # Check all exercises exist in one query, only ids are needed for the links
         result = await session.exec(
-            select(Exercise).where(Exercise.id.in_(exercise_ids))
+            select(Exercise.id).where(Exercise.id.in_(list(position_map)))
         )
-        exercises = list(result.all())
 
         # Fail fast: all exercises must exist
-        found_ids = {ex.id for ex in exercises}
-        missing = set(exercise_ids) - found_ids
+        missing = position_map.keys() - set(result.all())
         if missing:
             raise ValueError(f"Exercises not found in DB: {missing}")
 
-        # Build position map before reordering
-        position_map = {
-            ex.exercise.id: ex.position for ex in quiz_in.exercise_positions
-        }
-    else:
-        exercises = []
-        position_map = {}
-
     db_quiz = Quiz(
         owner_id=owner_id,
         status=quiz_in.status or "new",
         title=quiz_in.title,
     )
     session.add(db_quiz)
-    await session.flush()
-
-    # Create links
-    for exercise in exercises:
-        quiz_exercise = QuizExercise(
-            quiz_id=db_quiz.id,
-            exercise_id=exercise.id,
-            position=position_map[exercise.id],
-        )
-        session.add(quiz_exercise)
 
+    # Create links, the id is generated client-side and the
+    # ORM insert autoflushes the pending quiz in the same call
+    await insert_quiz_exercises(
+        session=session,
+        quiz_id=db_quiz.id,
+        exercise_positions=list(position_map.items()),
+    )
     await session.flush()
 
 
@@ -262,63 +474,42 @@ async def update_quiz(
     :param session: The database session.
     :return: The updated QuizPublic object if found, otherwise None.
     """
-    statement = (
-        select(Quiz)
-        .where(Quiz.id == quiz_id)
-        .options(selectinload(Quiz.quiz_exercises).selectinload(QuizExercise.exercise))
-    )
-    db_quiz = (await session.exec(statement)).first()
+    db_quiz = await get_quiz_with_exercises(quiz_id=quiz_id, session=session)
 
     if not db_quiz:
         return None
 
+    # status and title go out together in one UPDATE
     if quiz_in.status is not None:
         db_quiz.status = quiz_in.status
-        session.add(db_quiz)
-        await session.flush()
     if quiz_in.title is not None:
         db_quiz.title = quiz_in.title
-        session.add(db_quiz)
-        await session.flush()
+    await session.flush()
 
     if "exercise_positions" in quiz_in.model_fields_set:
-        # Clear existing links
-        for link in db_quiz.quiz_exercises:
-            await session.delete(link)
-        await session.flush()
+        # Clear existing links in a single DELETE
+        await session.exec(
+            delete(QuizExercise).where(QuizExercise.quiz_id == db_quiz.id)
+        )
+        # the loaded links and the viewonly collection no longer match the link
+        # table, expired they are selected again by get_quiz_with_exercises
+        session.expire(db_quiz, ["quiz_exercises", "exercises"])
 
         # Add new links
         if quiz_in.exercise_positions is not None:
-            for ex_pos in quiz_in.exercise_positions:
-                quiz_exercise = QuizExercise(
-                    quiz_id=db_quiz.id,
-                    exercise_id=ex_pos.exercise.id,  # ex_pos is QuizExerciseData
-                    position=ex_pos.position,
-                )
-                session.add(quiz_exercise)
-
-            await session.flush()
-        await session.refresh(db_quiz, attribute_names=["quiz_exercises"])
-
-    await session.refresh(db_quiz)
-
-    exercises_data = [
-        QuizExerciseDataPublic(
-            exercise=ExercisePublic.model_validate(qe.exercise),
-            position=qe.position,
-        )
-        for qe in db_quiz.quiz_exercises
-    ]
+            await insert_quiz_exercises(
+                session=session,
+                quiz_id=db_quiz.id,
+                exercise_positions=[
+                    # ex_pos is QuizExerciseData
+                    (ex_pos.exercise_id, ex_pos.position)
+                    for ex_pos in quiz_in.exercise_positions
+                ],
+            )
+        # reloads the new links together with their exercises
+        db_quiz = await get_quiz_with_exercises(quiz_id=quiz_id, session=session)
 
-    quiz_public = QuizPublic(
-        id=db_quiz.id,
-        owner_id=db_quiz.owner_id,
-        status=db_quiz.status,
-        exercises=exercises_data,
-        title=db_quiz.title,
-    )
-
-    return quiz_public
+    return quiz_to_public(db_quiz)
 
 
 async def delete_quiz(quiz_id: str, session: AsyncSession) -> bool:
@@ -349,48 +540,70 @@ async def start_new_quiz(
     :returns: QuizPublic - public representation of the started quiz.
     """
 
+    # User row lock keeps concurrent starts from racing past the deactivation
     await session.exec(select(User).where(User.id == owner_id).with_for_update())
-    # Creating quiz in the database with given parameters
-    quiz = await form_quiz(
+    # Deactivating any existing active quizzes for the user
+    await deactivate_quizzes(owner_id=owner_id, session=session)
+
+    # Creating quiz in the database with given parameters, already active
+    quiz, exercise_positions = await form_quiz(
         length=quiz_data.length,
         tags=quiz_data.tags,
         owner_id=owner_id,
         title=quiz_data.title,
         session=session,
+        status=QuizStatusChoices.ACTIVE.value,
     )
 
-    # Deactivating any existing active quizzes for the user
-    await deactivate_quizzes(owner_id=owner_id, session=session)
-    # Setting the new quiz status to active
-    quiz.status = QuizStatusChoices.ACTIVE.value
+    # Coverting to QuizPublic format, exercises are already in memory from form_quiz
+    return quiz_to_public(quiz, exercise_positions)
 
-    session.add(quiz)
-    await session.flush()
 
-    await session.refresh(quiz)
+async def mark_answers(
+    session: AsyncSession, quiz: Quiz, answers: SubmitAnswer
+) -> None:
+    """Check answers against exercise solutions and mark correctness on quiz links.
 
-    # Coverting to QuizPublic format
-    statement = (
-        select(Exercise, QuizExercise.position)
-        .join(QuizExercise)
-        .where(QuizExercise.quiz_id == quiz.id)
-        .order_by(QuizExercise.position)
-    )
-    result = await session.exec(statement)
-    exercise_data = result.all()
+    :param session: The database session.
+    :param quiz: The Quiz object the answers belong to.
+    :param answers: The answers to check.
+    """
+    # last answer per exercise wins, answers are stripped here and solutions in SQL
+    latest: dict[str, str] = {}
+    for answer in answers.response:
+        exercise_id = answer.get("exercise_id")
+        if not exercise_id:
+            logger.warning("Missing exercise_id in answer: %s", answer)
+            continue
+        latest[exercise_id] = (answer.get("answer") or "").strip()
 
-    exercises = [
-        QuizExerciseDataPublic(exercise=ExercisePublic.model_validate(ex), position=pos)
-        for ex, pos in exercise_data
-    ]
+    if not latest:
+        return
 
-    return QuizPublic(
-        id=quiz.id,
-        owner_id=quiz.owner_id,
-        status=quiz.status,
-        title=quiz.title,
-        exercises=exercises,
+    # one UPDATE ... FROM exercise, (VALUES ...) compares every answer server-side,
+    # so solutions never cross the wire
+    answer_rows = values(
+        column("exercise_id", String), column("answer", String), name="answers"
+    ).data(list(latest.items()))
+    statement = (
+        update(QuizExercise)
+        .where(
+            QuizExercise.quiz_id == quiz.id,
+            QuizExercise.exercise_id == Exercise.id,
+            Exercise.id == answer_rows.c.exercise_id,
+        )
+        .values(
+            is_correct=func.btrim(Exercise.solution, _WHITESPACE)
+            == answer_rows.c.answer
+        )
+        .returning(QuizExercise)
+        # RETURNING refreshes links already in the session instead of expiring them
+        .execution_options(synchronize_session=False, populate_existing=True)
     )
+    marked = (await session.exec(statement)).scalars().all()
+
+    for exercise_id in latest.keys() - set(map(_GET_EXERCISE_ID, marked)):
+        logger.warning("Exercise ID %s not found in quiz %s", exercise_id, quiz.id)
 
 
 async def save_quiz_progress(
@@ -402,41 +615,11 @@ async def save_quiz_progress(
     :param quiz: The Quiz object being progressed.
     :param answers: The answers provided so far.
     """
-    # pulling exercises linked to the quiz
-    statement = (
-        select(Exercise, QuizExercise)
-        .join(QuizExercise)
-        .where(QuizExercise.quiz_id == quiz.id)
-        .order_by(QuizExercise.position)
-    )
-    exercise_data = (await session.exec(statement)).all()
-
-    # making maps for easy access
-    solution_map = {ex.id: ex.solution for ex, quiz_ex in exercise_data}
-
-    exercise_map = {ex.id: quiz_ex for ex, quiz_ex in exercise_data}
-
-    # checking answers, marking correctness
-    for answer in answers.response:
-        exercise_id = answer.get("exercise_id")
-        user_answer = answer.get("answer") or ""
-        if not exercise_id:
-            logger.warning("Missing exercise_id in answer: %s", answer)
-        if exercise_id in solution_map:
-            quiz_exercise = exercise_map[exercise_id]
-
-            correct = user_answer.strip() == solution_map[exercise_id].strip()
-
-            # Update correctness
-            quiz_exercise.is_correct = correct
-            session.add(quiz_exercise)
-        else:
-            logger.warning("Exercise ID %s not found in quiz %s", exercise_id, quiz.id)
+    await mark_answers(session=session, quiz=quiz, answers=answers)
 
     quiz.status = QuizStatusChoices.ACTIVE.value
     session.add(quiz)
     await session.flush()
-    await session.refresh(quiz)
 
 
 async def load_active_quiz(session: AsyncSession, owner_id: str) -> QuizPublic | None:
@@ -446,33 +629,12 @@ async def load_active_quiz(session: AsyncSession, owner_id: str) -> QuizPublic |
     :param owner_id: The ID of the user whose active quiz is to be loaded.
     :returns: QuizPublic - public representation of the active quiz, or None if not found.
     """
-    statement = (
-        select(Quiz)
-        .where(Quiz.owner_id == owner_id, Quiz.status == QuizStatusChoices.ACTIVE.value)
-        .options(selectinload(Quiz.quiz_exercises).selectinload(QuizExercise.exercise))
-        .order_by(Quiz.id)  # Eager load exercises
-    )
-    quiz = (await session.exec(statement)).first()
+    quiz = (await session.scalars(_active_quiz_statement(owner_id))).first()
 
     if not quiz:
         return None
 
-    exercises_data = [
-        QuizExerciseDataPublic(
-            exercise=ExercisePublic.model_validate(qe.exercise),
-            position=qe.position,
-        )
-        for qe in quiz.quiz_exercises
-    ]
-
-    response = QuizPublic(
-        id=quiz.id,
-        owner_id=quiz.owner_id,
-        status=quiz.status,
-        exercises=exercises_data,
-        title=quiz.title,
-    )
-    return response
+    return quiz_to_public(quiz)
 
 
 async def submit_quiz(session: AsyncSession, quiz: Quiz, answers: SubmitAnswer):
@@ -482,34 +644,8 @@ async def submit_quiz(session: AsyncSession, quiz: Quiz, answers: SubmitAnswer):
     :param quiz: The Quiz object being submitted.
     :param answers: The final answers provided.
     """
-    statement = (
-        select(Exercise, QuizExercise)
-        .join(QuizExercise)
-        .where(QuizExercise.quiz_id == quiz.id)
-        .order_by(QuizExercise.position)
-    )
-    exercise_data = (await session.exec(statement)).all()
-
-    # making maps for easy access
-    solution_map = {ex.id: ex.solution for ex, quiz_ex in exercise_data}
-
-    exercise_map = {ex.id: quiz_ex for ex, quiz_ex in exercise_data}
-
-    for answer in answers.response:
-        exercise_id = answer.get("exercise_id")
-        user_answer = answer.get("answer") or ""
-        if not exercise_id:
-            logger.warning("Missing exercise_id in answer: %s", answer)
-        if exercise_id in solution_map:
-            quiz_exercise = exercise_map[exercise_id]
-
-            correct = user_answer.strip() == solution_map[exercise_id].strip()
+    await mark_answers(session=session, quiz=quiz, answers=answers)
 
-            quiz_exercise.is_correct = correct
-            session.add(quiz_exercise)
-        else:
-            logger.warning("Exercise ID %s not found in quiz %s", exercise_id, quiz.id)
     quiz.status = QuizStatusChoices.SUBMITTED.value
     session.add(quiz)
     await session.flush()
-    await session.refresh(quiz)
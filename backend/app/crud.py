@@ -1,4 +1,3 @@
-from uuid_extensions import uuid7str
 from typing import Any
 
 from sqlmodel import select
@@ -29,7 +28,6 @@ async def create_user(*, session: AsyncSession, user_create: UserCreate) -> User
     )
     session.add(db_obj)
     await session.flush()
-    await session.refresh(db_obj)
     return db_obj
 
 
@@ -53,7 +51,6 @@ async def update_user(
     db_user.sqlmodel_update(user_data, update=extra_data)
     session.add(db_user)
     await session.commit()
-    await session.refresh(db_user)
     return db_user
 
 
@@ -103,7 +100,6 @@ async def create_item(
     db_item = Item.model_validate(item_in, update={"owner_id": owner_id})
     session.add(db_item)
     await session.commit()
-    await session.refresh(db_item)
     return db_item
 
 
@@ -120,5 +116,4 @@ async def create_exercise(
     db_exercise = Exercise.model_validate(exercise_in)
     session.add(db_exercise)
     await session.commit()
-    await session.refresh(db_exercise)
     return db_exercise
@@ -6,6 +6,7 @@ from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.api.routing import PydanticCoreJSONResponse
 from app.core.config import settings
 
 
@@ -20,6 +21,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=PydanticCoreJSONResponse,
 )
 
 # Set all CORS enabled origins
@@ -1,10 +1,11 @@
 from uuid_extensions import uuid7str
 from enum import Enum
+from typing import TypedDict
 
 from pydantic import EmailStr
 from sqlmodel import Field, Relationship, SQLModel
-from sqlalchemy import Column, String, CheckConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, Enum as SAEnum, Index, String, text
+from sqlalchemy.dialects.postgresql import ARRAY
 
 
 # Shared properties
@@ -104,15 +105,17 @@ class User(UserBase, table=True):
     __tablename__ = "user"
     id: str = Field(default_factory=uuid7str, primary_key=True)
     hashed_password: str
+    # not loaded with the user, every authenticated request fetches current_user.
+    # Deleting a user leaves the cascade to the ondelete="CASCADE" foreign keys
     items: list["Item"] = Relationship(
         back_populates="owner",
         cascade_delete=True,
-        sa_relationship_kwargs={"lazy": "selectin"},
+        passive_deletes=True,
     )
     quizzes: list["Quiz"] = Relationship(
         back_populates="owner",
         cascade_delete=True,
-        sa_relationship_kwargs={"lazy": "selectin"},
+        passive_deletes=True,
     )
 
 
@@ -121,9 +124,15 @@ class UserPublic(UserBase):
     """Public user data model for API responses. Inherits from UserBase.
 
     Attributes:
+        email: Email address as stored, already validated and normalized on input.
         id: Unique identifier for the user.
     """
 
+    # output only, email-validator already ran when the address was written.
+    # The schema still advertises the email format to API clients
+    email: str = Field(
+        max_length=255, schema_extra={"json_schema_extra": {"format": "email"}}
+    )
     id: str
 
 
@@ -182,10 +191,12 @@ class Item(ItemBase, table=True):
 
     __tablename__ = "item"
     id: str = Field(default_factory=uuid7str, primary_key=True)
-    owner_id: str = Field(foreign_key="user.id", nullable=False, ondelete="CASCADE")
-    owner: User | None = Relationship(
-        back_populates="items", sa_relationship_kwargs={"lazy": "selectin"}
+    # indexed, items are listed and counted per owner
+    owner_id: str = Field(
+        foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
     )
+    # ItemPublic only carries owner_id, load the owner per query when needed
+    owner: User | None = Relationship(back_populates="items")
 
 
 # Properties to return via API, id is always required
@@ -273,6 +284,16 @@ class QuizExercise(SQLModel, table=True):
     """
 
     __tablename__ = "quizexercise"
+    # quiz links are always read per quiz in position order, remaining columns
+    # are included so those reads can be answered from the index alone
+    __table_args__ = (
+        Index(
+            "ix_quizexercise_quiz_id_position",
+            "quiz_id",
+            "position",
+            postgresql_include=["exercise_id", "is_correct"],
+        ),
+    )
     quiz_id: str = Field(
         foreign_key="quiz.id",
         primary_key=True,
@@ -355,28 +376,25 @@ class Exercise(ExerciseBase, table=True):
     """
 
     __tablename__ = "exercise"
+    __table_args__ = (Index("ix_exercise_tags", "tags", postgresql_using="gin"),)
     id: str = Field(default_factory=uuid7str, primary_key=True)
-    answers: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
+    # native text arrays, decoded by the driver without a JSON parse.
+    # tags is filtered with && against the GIN index
+    answers: list[str] = Field(default_factory=list, sa_column=Column(ARRAY(String)))
     illustration: list[str] | None = Field(
-        default_factory=list, sa_column=Column(JSONB)
+        default_factory=list, sa_column=Column(ARRAY(String))
     )
-    tags: list[str] = Field(default_factory=list, sa_column=Column(JSONB))
+    tags: list[str] = Field(default_factory=list, sa_column=Column(ARRAY(String)))
+    # read-only view over the link table, links are written through QuizExercise.
+    # Not eager-loaded, load it per query with selectinload when needed
     quizzes: list["Quiz"] = Relationship(
-        back_populates="exercises",
-        link_model=QuizExercise,
-        sa_relationship_kwargs={
-            "lazy": "selectin",
-            "cascade": "all, delete",  # ORM cascade
-            "passive_deletes": True,  # Trust DB to handle deletes
-            "overlaps": "quiz",
-        },
+        link_model=QuizExercise, sa_relationship_kwargs={"viewonly": True}
     )
     quiz_exercises: list["QuizExercise"] = Relationship(
         back_populates="exercise",
         sa_relationship_kwargs={
             "cascade": "all, delete",
-            "passive_deletes": True,
-            "overlaps": "quizzes",
+            "passive_deletes": True,  # Trust DB to handle deletes
         },
     )
     solution: str
@@ -472,46 +490,56 @@ class Quiz(QuizBase, table=True):
     """
 
     __tablename__ = "quiz"
+    __table_args__ = (
+        # quizzes are listed per owner in id order, the index serves both the filter
+        # and the ORDER BY ... LIMIT page without a sort
+        Index("ix_quiz_owner_id_id", "owner_id", "id"),
+        # at most one active quiz per user, enforced by postgres
+        Index(
+            "idx_active_quiz_per_user",
+            "owner_id",
+            unique=True,
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
     id: str = Field(default_factory=uuid7str, primary_key=True)
     owner_id: str = Field(foreign_key="user.id", nullable=False, ondelete="CASCADE")
     owner: User | None = Relationship(back_populates="quizzes")
+    # read-only view over the link table, links are written through quiz_exercises.
+    # Not eager-loaded, QuizPublic is built from quiz_exercises alone
     exercises: list["Exercise"] = Relationship(
-        back_populates="quizzes",
-        link_model=QuizExercise,
-        sa_relationship_kwargs={
-            "lazy": "selectin",
-            "cascade": "all, delete",
-            "passive_deletes": True,
-            "overlaps": "exercise,quiz_exercises",
-        },
+        link_model=QuizExercise, sa_relationship_kwargs={"viewonly": True}
     )
+    # native enum, stored in 4 bytes and validated by postgres
     status: str = Field(
         default=QuizStatusChoices.NEW.value,
         sa_column=Column(
             "status",
-            String,
-            CheckConstraint(
-                "status IN ('new', 'in_progress', 'active', 'submitted', 'graded')",
-                name="valid_quiz_status",
-            ),
+            SAEnum(*(choice.value for choice in QuizStatusChoices), name="quiz_status"),
             nullable=False,
+            server_default=QuizStatusChoices.NEW.value,
         ),
     )
     quiz_exercises: list["QuizExercise"] = Relationship(
         back_populates="quiz",
-        sa_relationship_kwargs={"lazy": "selectin", "overlaps": "exercises,quizzes"},
+        sa_relationship_kwargs={
+            "lazy": "selectin",
+            "order_by": "QuizExercise.position",
+            "cascade": "all, delete",
+            "passive_deletes": True,
+        },
     )
 
 
 class QuizExerciseData(SQLModel):
-    """Model representing an exercise within a quiz along with its position.
+    """Model referencing an exercise within a quiz along with its position.
 
     Attributes:
-        exercise: Exercise object.
+        exercise_id: ID of the exercise.
         position: Position of the exercise in the quiz.
     """
 
-    exercise: Exercise
+    exercise_id: str
     position: int
 
 
@@ -557,14 +585,30 @@ class QuizzesPublic(SQLModel):
     count: int
 
 
+class AnswerItem(TypedDict, total=False):
+    """Single answer within a submission.
+
+    Keys are optional, answers without an exercise_id are skipped when marking.
+
+    Attributes:
+        exercise_id: ID of the answered exercise.
+        answer: The answer given, None if left blank.
+    """
+
+    exercise_id: str | None
+    answer: str | None
+
+
 class SubmitAnswer(SQLModel):
     """Model for submitting answers to the quiz.
 
     Attributes:
-        response: list of dicts with exercise_id and answer.
+        response: list of answers with exercise_id and answer.
     """
 
-    response: list[dict[str, str | None]]  # [{"exercise_id": str, "answer": str}, ...]
+    # fixed keys validate straight to their fields, without trying every union
+    # branch per dict value
+    response: list[AnswerItem]
 
 
 class StartQuizRequest(SQLModel):
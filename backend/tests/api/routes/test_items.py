@@ -84,6 +84,33 @@ async def test_read_items(
     assert len(content["data"]) >= 2
 
 
+async def test_read_items_count_past_last_page(
+    client_with_test_db: AsyncClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    await create_random_item(db)
+    await create_random_item(db)
+    response = await client_with_test_db.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=superuser_token_headers,
+        params={"limit": 1},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert len(content["data"]) == 1
+    count = content["count"]
+    assert count >= 2
+
+    response = await client_with_test_db.get(
+        f"{settings.API_V1_STR}/items/",
+        headers=superuser_token_headers,
+        params={"skip": count},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["data"] == []
+    assert content["count"] == count
+
+
 async def test_update_item(
     client_with_test_db: AsyncClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
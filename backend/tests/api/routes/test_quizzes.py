@@ -14,7 +14,7 @@ from sqlalchemy.orm import joinedload
 
 from app.core.config import settings
 from tests.utils.user import create_random_user, user_authentication_headers
-from tests.utils.quiz import create_random_quiz
+from tests.utils.quiz import create_random_quiz, quiz_links
 from tests.utils.exercise import create_random_exercise
 from app.models import (
     ExercisePublic,
@@ -46,7 +46,7 @@ async def test_create_quiz(client_with_test_db: AsyncClient, db: AsyncSession) -
     )
     exercises = [(await create_random_exercise(db)) for _ in range(3)]
     exercise_positions = [
-        QuizExerciseData.model_validate({"exercise": ex, "position": i})
+        QuizExerciseData(exercise_id=ex.id, position=i)
         for i, ex in enumerate(exercises)
     ]
     quiz_in = QuizCreate(
@@ -64,6 +64,51 @@ async def test_create_quiz(client_with_test_db: AsyncClient, db: AsyncSession) -
     assert content["message"] == "Quiz created successfully"
 
 
+async def test_create_quiz_invalid_json(
+    client_with_test_db: AsyncClient, db: AsyncSession
+) -> None:
+    """
+    Test quiz creation with a malformed JSON body.
+
+    Ensures that a body the JSON parser rejects is reported as a 422 validation
+    error, not a generic 400.
+    """
+    user = await create_random_user(db)
+    headers = await user_authentication_headers(
+        client=client_with_test_db, email=user.email, password="testpass"
+    )
+    response = await client_with_test_db.post(
+        f"{settings.API_V1_STR}/users/{user.id}/quizzes/",
+        headers={**headers, "Content-Type": "application/json"},
+        content=b'{"status": "new", "exercise_positions": [',
+    )
+    assert response.status_code == 422
+    content = response.json()
+    assert content["detail"][0]["type"] == "json_invalid"
+
+
+async def test_create_quiz_invalid_json_position(
+    client_with_test_db: AsyncClient, db: AsyncSession
+) -> None:
+    """
+    Test that a malformed JSON body is reported at the offending character.
+    """
+    user = await create_random_user(db)
+    headers = await user_authentication_headers(
+        client=client_with_test_db, email=user.email, password="testpass"
+    )
+    response = await client_with_test_db.post(
+        f"{settings.API_V1_STR}/users/{user.id}/quizzes/",
+        headers={**headers, "Content-Type": "application/json"},
+        content=b'{"status": "new", "title": }',
+    )
+    assert response.status_code == 422
+    content = response.json()
+    # same location json.loads would report, the closing brace at index 27
+    assert content["detail"][0]["loc"] == ["body", 27]
+    assert content["detail"][0]["ctx"]["error"] == "expected value"
+
+
 async def test_create_quiz_for_other_user(
     client_with_test_db: AsyncClient,
     db: AsyncSession,
@@ -264,6 +309,38 @@ async def test_update_quiz(
     assert content["status"] == update_data["status"]
 
 
+async def test_update_quiz_with_exercises_cleared_session(
+    client_with_test_db: AsyncClient,
+    db: AsyncSession,
+) -> None:
+    """
+    Test updating a quiz whose exercises are not in the session.
+
+    Verifies that the route loads the quiz exercises itself instead of relying
+    on objects left in the identity map by the test setup.
+    """
+    user = await create_random_user(db)
+    exercise = await create_random_exercise(db)
+    quiz = Quiz(owner_id=user.id, title="Old", quiz_exercises=quiz_links([exercise]))
+    db.add(quiz)
+    await db.flush()
+    headers = await user_authentication_headers(
+        client=client_with_test_db, email=user.email, password="testpass"
+    )
+    url = f"{settings.API_V1_STR}/users/{user.id}/quizzes/{quiz.id}"
+    exercise_id = exercise.id
+
+    db.expunge_all()
+    response = await client_with_test_db.put(
+        url, headers=headers, json={"title": "New Title"}
+    )
+
+    assert response.status_code == 200
+    content = response.json()
+    assert content["title"] == "New Title"
+    assert [ex["exercise"]["id"] for ex in content["exercises"]] == [exercise_id]
+
+
 async def test_update_quiz_not_found(
     client_with_test_db: AsyncClient, db: AsyncSession
 ) -> None:
@@ -582,7 +659,7 @@ async def test_save_quiz_route(
     quiz = Quiz(
         owner_id=user.id,
         status=QuizStatusChoices.ACTIVE.value,
-        exercises=[exercise],
+        quiz_exercises=quiz_links([exercise]),
     )
     db.add(quiz)
     await db.flush()
@@ -634,7 +711,7 @@ async def test_save_quiz_submitted_quiz(
     quiz = Quiz(
         owner_id=user.id,
         status=QuizStatusChoices.SUBMITTED.value,
-        exercises=[exercise],
+        quiz_exercises=quiz_links([exercise]),
     )
     answers = SubmitAnswer(
         response=[{"exercise_id": exercise.id, "answer": exercise.solution}]
@@ -692,7 +769,9 @@ async def test_save_quiz_empty_answers(
 
     exercise = await create_random_exercise(db)
     quiz = Quiz(
-        owner_id=user.id, status=QuizStatusChoices.ACTIVE.value, exercises=[exercise]
+        owner_id=user.id,
+        status=QuizStatusChoices.ACTIVE.value,
+        quiz_exercises=quiz_links([exercise]),
     )
     db.add(quiz)
     await db.flush()
@@ -864,7 +943,7 @@ async def test_submit_quiz(client_with_test_db: AsyncClient, db: AsyncSession) -
     quiz = Quiz(
         owner_id=user.id,
         status=QuizStatusChoices.ACTIVE.value,
-        exercises=[exercise1, exercise2],
+        quiz_exercises=quiz_links([exercise1, exercise2]),
     )
 
     db.add(quiz)
@@ -1020,7 +1099,7 @@ async def test_submit_quiz_missing_answers(
     quiz = Quiz(
         owner_id=user.id,
         status=QuizStatusChoices.ACTIVE.value,
-        exercises=[exercise1, exercise2],
+        quiz_exercises=quiz_links([exercise1, exercise2]),
     )
     db.add(quiz)
     await db.flush()
@@ -2,12 +2,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from uuid_extensions import uuid7str
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 
 from app.core.quiz import *
 from app.models import QuizExerciseData
 from tests.utils.exercise import create_random_exercise
+from tests.utils.quiz import quiz_links
 from tests.utils.user import create_random_user
 
 pytestmark = pytest.mark.asyncio(loop_scope="module")
@@ -27,15 +29,16 @@ async def test_form_quiz(
     for _ in range(10):
         exercise = await create_random_exercise(db, tags=tags)
 
-    quiz = await form_quiz(
+    quiz, exercises = await form_quiz(
         length=5, tags=tags, owner_id=owner_id, title=title, session=db
     )
 
     assert quiz.title == title
     assert quiz.owner_id == owner_id
-    assert len(quiz.exercises) == 5
-    for exercise in quiz.exercises:
+    assert len(exercises) == 5
+    for exercise, _ in exercises:
         assert "algebra" in exercise.tags
+    assert [position for _, position in exercises] == list(range(5))
 
 
 async def test_form_quiz_not_enough_exercises(db: AsyncSession):
@@ -46,21 +49,36 @@ async def test_form_quiz_not_enough_exercises(db: AsyncSession):
     for _ in range(2):
         await create_random_exercise(db, tags=tags)
 
-    quiz = await form_quiz(length=5, tags=tags, owner_id=user.id, session=db)
+    quiz, exercises = await form_quiz(length=5, tags=tags, owner_id=user.id, session=db)
 
-    assert len(quiz.exercises) == 2  # Must be 2 since only 2 exercises are available
+    assert len(exercises) == 2  # Must be 2 since only 2 exercises are available
     assert quiz.title is None
 
 
+async def test_sample_tagged_exercises_reaches_every_match(db: AsyncSession):
+    tag = uuid7str()
+    exercise_ids = {(await create_random_exercise(db, tags=[tag])).id for _ in range(6)}
+
+    picked = set()
+    for _ in range(100):
+        picked.update(
+            exercise.id
+            for exercise in await sample_tagged_exercises(session=db, tags=[tag], k=1)
+        )
+
+    # wherever the random floor lands, the wrap-around reads the matches below it
+    assert picked == exercise_ids
+
+
 async def test_form_quiz_no_tags_returns_random_exercises(db: AsyncSession):
     user = await create_random_user(db)
 
     for _ in range(5):
         await create_random_exercise(db, tags=["math"])
 
-    quiz = await form_quiz(length=3, tags=None, owner_id=user.id, session=db)
+    quiz, exercises = await form_quiz(length=3, tags=None, owner_id=user.id, session=db)
 
-    assert len(quiz.exercises) == 3
+    assert len(exercises) == 3
     assert quiz.owner_id == user.id
     assert quiz.title is None
 
@@ -71,25 +89,29 @@ async def test_form_quiz_empty_tags_returns_random_exercises(db: AsyncSession):
     for _ in range(4):
         await create_random_exercise(db, tags=["physics"])
 
-    quiz = await form_quiz(length=2, tags=[], owner_id=user.id, session=db)
+    quiz, exercises = await form_quiz(length=2, tags=[], owner_id=user.id, session=db)
 
-    assert len(quiz.exercises) == 2
+    assert len(exercises) == 2
 
 
 async def test_form_quiz_length_zero_returns_empty_quiz(db: AsyncSession):
     user = await create_random_user(db)
-    quiz = await form_quiz(length=0, tags=["math"], owner_id=user.id, session=db)
+    quiz, exercises = await form_quiz(
+        length=0, tags=["math"], owner_id=user.id, session=db
+    )
 
-    assert len(quiz.exercises) == 0
+    assert len(exercises) == 0
     assert quiz.owner_id == user.id
 
 
 async def test_form_quiz_no_exercises_in_db(db: AsyncSession):
     user = await create_random_user(db)
 
-    quiz = await form_quiz(length=3, tags=["math"], owner_id=user.id, session=db)
+    quiz, exercises = await form_quiz(
+        length=3, tags=["math"], owner_id=user.id, session=db
+    )
 
-    assert len(quiz.exercises) == 0
+    assert len(exercises) == 0
     assert quiz.owner_id == user.id
 
 
@@ -101,10 +123,12 @@ async def test_form_quiz_owner_not_exists_still_works(db: AsyncSession):
     for _ in range(3):
         await create_random_exercise(db, tags=tags)
 
-    quiz = await form_quiz(length=2, tags=tags, owner_id=fake_owner_id, session=db)
+    quiz, exercises = await form_quiz(
+        length=2, tags=tags, owner_id=fake_owner_id, session=db
+    )
 
     assert quiz.owner_id == fake_owner_id
-    assert len(quiz.exercises) == 2
+    assert len(exercises) == 2
 
 
 async def test_deactivate_quizzes(db: AsyncSession):
@@ -147,7 +171,7 @@ async def test_get_quiz_by_id(db: AsyncSession):
     quiz = Quiz(
         owner_id=user.id,
         status=QuizStatusChoices.ACTIVE.value,
-        exercises=[exercise1, exercise2],
+        quiz_exercises=quiz_links([exercise1, exercise2]),
     )
     db.add(quiz)
     await db.flush()
@@ -184,7 +208,7 @@ async def test_get_all_quizzes_by_owner(db: AsyncSession):
         quiz = Quiz(
             owner_id=user.id,
             status=QuizStatusChoices.NEW.value,
-            exercises=[exercise],
+            quiz_exercises=quiz_links([exercise]),
             title=f"Quiz {i + 1}",
         )
         db.add(quiz)
@@ -213,6 +237,33 @@ async def test_get_all_quizzes_by_owner(db: AsyncSession):
         assert quiz.exercises[0].position == 0
 
 
+async def test_get_all_quizzes_by_owner_paginated(db: AsyncSession):
+    """Tests skip and limit in the get_all_quizzes_by_owner function."""
+
+    user = await create_random_user(db)
+
+    for i in range(3):
+        exercise = await create_random_exercise(db)
+        quiz = Quiz(
+            owner_id=user.id,
+            status=QuizStatusChoices.NEW.value,
+            quiz_exercises=quiz_links([exercise]),
+            title=f"Quiz {i + 1}",
+        )
+        db.add(quiz)
+
+    await db.flush()
+
+    all_quizzes = await get_all_quizzes_by_owner(owner_id=user.id, session=db)
+    page = await get_all_quizzes_by_owner(
+        owner_id=user.id, session=db, skip=1, limit=1
+    )
+
+    assert len(page) == 1
+    assert page[0].id == all_quizzes[1].id
+    assert len(page[0].exercises) == 1
+
+
 async def test_create_quiz(db: AsyncSession):
     """Tests the create_quiz function."""
 
@@ -224,8 +275,8 @@ async def test_create_quiz(db: AsyncSession):
     quiz_in = QuizCreate(
         title="New Quiz",
         exercise_positions=[
-            QuizExerciseData(exercise=exercise1, position=1),
-            QuizExerciseData(exercise=exercise2, position=2),
+            QuizExerciseData(exercise_id=exercise1.id, position=1),
+            QuizExerciseData(exercise_id=exercise2.id, position=2),
         ],
     )
 
@@ -252,8 +303,8 @@ async def test_create_quiz_raises_on_duplicate_exercise(db: AsyncSession):
 
     quiz_in = QuizCreate(
         exercise_positions=[
-            QuizExerciseData(exercise=exercise, position=0),
-            QuizExerciseData(exercise=exercise, position=1),
+            QuizExerciseData(exercise_id=exercise.id, position=0),
+            QuizExerciseData(exercise_id=exercise.id, position=1),
         ]
     )
 
@@ -265,11 +316,10 @@ async def test_create_quiz_raises_on_missing_exercise(db: AsyncSession):
     user = await create_random_user(db)
     real_ex = await create_random_exercise(db)
 
-    fake_ex = Exercise(id="nonexistent", question="fake", solution="fake", tags=[])
     quiz_in = QuizCreate(
         exercise_positions=[
-            QuizExerciseData(exercise=real_ex, position=0),
-            QuizExerciseData(exercise=fake_ex, position=1),
+            QuizExerciseData(exercise_id=real_ex.id, position=0),
+            QuizExerciseData(exercise_id="nonexistent", position=1),
         ]
     )
 
@@ -288,7 +338,7 @@ async def test_update_quiz(db: AsyncSession):
     quiz = Quiz(
         owner_id=user.id,
         title="Original Quiz",
-        exercises=[exercise1],
+        quiz_exercises=quiz_links([exercise1]),
     )
     db.add(quiz)
     await db.flush()
@@ -296,8 +346,8 @@ async def test_update_quiz(db: AsyncSession):
     quiz_update = QuizUpdate(
         title="Updated Quiz",
         exercise_positions=[
-            QuizExerciseData(exercise=exercise1, position=0),
-            QuizExerciseData(exercise=exercise2, position=1),
+            QuizExerciseData(exercise_id=exercise1.id, position=0),
+            QuizExerciseData(exercise_id=exercise2.id, position=1),
         ],
     )
 
@@ -309,6 +359,86 @@ async def test_update_quiz(db: AsyncSession):
     assert updated_quiz.exercises[1].position == 1
 
 
+async def test_update_quiz_with_cleared_session(db: AsyncSession):
+    """Tests updating a quiz whose exercises are not in the identity map."""
+
+    user = await create_random_user(db)
+    exercise = await create_random_exercise(db)
+
+    quiz = Quiz(owner_id=user.id, title="Old", quiz_exercises=quiz_links([exercise]))
+    db.add(quiz)
+    await db.flush()
+    quiz_id = quiz.id
+    exercise_id = exercise.id
+
+    db.expunge_all()
+    # the route looks the quiz up first, loading its links but not their exercises
+    await db.get(Quiz, quiz_id)
+
+    quiz_update = QuizUpdate(title="New Title")
+    updated = await update_quiz(quiz_id=quiz_id, quiz_in=quiz_update, session=db)
+
+    assert updated.title == "New Title"
+    assert len(updated.exercises) == 1
+    assert updated.exercises[0].exercise.id == exercise_id
+
+
+async def test_update_quiz_exercises_with_cleared_session(db: AsyncSession):
+    """Tests replacing exercises when the new ones are not in the identity map."""
+
+    user = await create_random_user(db)
+    exercise1 = await create_random_exercise(db)
+    exercise2 = await create_random_exercise(db)
+
+    quiz = Quiz(owner_id=user.id, title="Old", quiz_exercises=quiz_links([exercise1]))
+    db.add(quiz)
+    await db.flush()
+    quiz_id = quiz.id
+    exercise2_id = exercise2.id
+
+    db.expunge_all()
+    await db.get(Quiz, quiz_id)
+
+    quiz_update = QuizUpdate(
+        exercise_positions=[QuizExerciseData(exercise_id=exercise2_id, position=0)],
+    )
+    updated = await update_quiz(quiz_id=quiz_id, quiz_in=quiz_update, session=db)
+
+    assert len(updated.exercises) == 1
+    assert updated.exercises[0].exercise.id == exercise2_id
+    assert updated.exercises[0].position == 0
+
+
+async def test_get_quiz_with_exercises_identity_map_hit(db: AsyncSession):
+    """Tests that a second lookup in the same session runs no SQL."""
+
+    user = await create_random_user(db)
+    exercise = await create_random_exercise(db)
+
+    quiz = Quiz(owner_id=user.id, title="Cached", quiz_exercises=quiz_links([exercise]))
+    db.add(quiz)
+    await db.flush()
+    quiz_id = quiz.id
+
+    db.expunge_all()
+    first = await get_quiz_with_exercises(quiz_id=quiz_id, session=db)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.bind.sync_engine, "before_cursor_execute", record)
+    try:
+        second = await get_quiz_with_exercises(quiz_id=quiz_id, session=db)
+    finally:
+        event.remove(db.bind.sync_engine, "before_cursor_execute", record)
+
+    assert second is first
+    assert statements == []
+    assert second.quiz_exercises[0].exercise.id == exercise.id
+
+
 async def test_update_quiz_exercises_replaced(db: AsyncSession):
     """Tests that updating a quiz replaces its exercises correctly."""
 
@@ -321,14 +451,14 @@ async def test_update_quiz_exercises_replaced(db: AsyncSession):
     quiz = Quiz(
         owner_id=user.id,
         title="Quiz to Update",
-        exercises=[exercise1, exercise2],
+        quiz_exercises=quiz_links([exercise1, exercise2]),
     )
     db.add(quiz)
     await db.flush()
 
     quiz_update = QuizUpdate(
         exercise_positions=[
-            QuizExerciseData(exercise=exercise3, position=0),
+            QuizExerciseData(exercise_id=exercise3.id, position=0),
         ],
     )
 
@@ -343,7 +473,7 @@ async def test_update_quiz_title_only_keeps_exercises(db: AsyncSession):
     user = await create_random_user(db)
     ex1 = await create_random_exercise(db)
 
-    quiz = Quiz(owner_id=user.id, title="Old", exercises=[ex1])
+    quiz = Quiz(owner_id=user.id, title="Old", quiz_exercises=quiz_links([ex1]))
     db.add(quiz)
     await db.flush()
 
@@ -360,12 +490,12 @@ async def test_update_quiz_exercises_only_keeps_title(db: AsyncSession):
     ex1 = await create_random_exercise(db)
     ex2 = await create_random_exercise(db)
 
-    quiz = Quiz(owner_id=user.id, title="Keep Me", exercises=[ex1])
+    quiz = Quiz(owner_id=user.id, title="Keep Me", quiz_exercises=quiz_links([ex1]))
     db.add(quiz)
     await db.flush()
 
     quiz_update = QuizUpdate(
-        exercise_positions=[QuizExerciseData(exercise=ex2, position=0)]
+        exercise_positions=[QuizExerciseData(exercise_id=ex2.id, position=0)]
     )
     updated = await update_quiz(quiz_id=quiz.id, quiz_in=quiz_update, session=db)
 
@@ -380,7 +510,7 @@ async def test_update_quiz_with_exercise_positions_none_does_not_keep_exercises(
     user = await create_random_user(db)
     ex = await create_random_exercise(db)
 
-    quiz = Quiz(owner_id=user.id, exercises=[ex])
+    quiz = Quiz(owner_id=user.id, quiz_exercises=quiz_links([ex]))
     db.add(quiz)
     await db.flush()
 
@@ -450,7 +580,9 @@ async def test_save_quiz_progress(db: AsyncSession):
     exercise = await create_random_exercise(db)
 
     quiz = Quiz(
-        owner_id=user.id, status=QuizStatusChoices.ACTIVE.value, exercises=[exercise]
+        owner_id=user.id,
+        status=QuizStatusChoices.ACTIVE.value,
+        quiz_exercises=quiz_links([exercise]),
     )
     db.add(quiz)
     await db.flush()
@@ -479,7 +611,7 @@ async def test_save_quiz_progress(db: AsyncSession):
 async def test_save_quiz_progress_handles_none_answer_gracefully(db: AsyncSession):
     user = await create_random_user(db)
     ex = await create_random_exercise(db)
-    quiz = Quiz(owner_id=user.id, status="active", exercises=[ex])
+    quiz = Quiz(owner_id=user.id, status="active", quiz_exercises=quiz_links([ex]))
     db.add(quiz)
     await db.flush()
 
@@ -497,7 +629,7 @@ async def test_save_quiz_progress_handles_none_answer_gracefully(db: AsyncSessio
 async def test_save_quiz_progress_last_answer_wins(db: AsyncSession):
     user = await create_random_user(db)
     ex = await create_random_exercise(db)
-    quiz = Quiz(owner_id=user.id, status="active", exercises=[ex])
+    quiz = Quiz(owner_id=user.id, status="active", quiz_exercises=quiz_links([ex]))
     db.add(quiz)
     await db.flush()
 
@@ -516,6 +648,28 @@ async def test_save_quiz_progress_last_answer_wins(db: AsyncSession):
     assert link.is_correct is True
 
 
+async def test_save_quiz_progress_strips_unicode_whitespace(db: AsyncSession):
+    """Tests that solutions and answers are trimmed by the same rule as str.strip()."""
+    user = await create_random_user(db)
+    ex = await create_random_exercise(db)
+    solution = ex.solution
+    ex.solution = f"\u2028{solution}\u00a0\x1c"
+    quiz = Quiz(owner_id=user.id, status="active", quiz_exercises=quiz_links([ex]))
+    db.add(quiz)
+    await db.flush()
+
+    answer = SubmitAnswer(
+        response=[{"exercise_id": ex.id, "answer": f"\u3000{solution}\u2029"}]
+    )
+
+    await save_quiz_progress(session=db, quiz=quiz, answers=answer)
+
+    link = (
+        await db.exec(select(QuizExercise).where(QuizExercise.exercise_id == ex.id))
+    ).one()
+    assert link.is_correct is True
+
+
 async def test_load_active_quiz(db: AsyncSession):
     user = await create_random_user(db)
 
@@ -606,7 +760,11 @@ async def test_load_active_quiz_excludes_deleted_exercises_gracefully(db: AsyncS
 async def test_submit_quiz(db: AsyncSession):
     user = await create_random_user(db)
     ex = await create_random_exercise(db)
-    quiz = Quiz(owner_id=user.id, status=QuizStatusChoices.ACTIVE.value, exercises=[ex])
+    quiz = Quiz(
+        owner_id=user.id,
+        status=QuizStatusChoices.ACTIVE.value,
+        quiz_exercises=quiz_links([ex]),
+    )
     db.add(quiz)
     await db.flush()
     await db.refresh(quiz)
@@ -625,7 +783,7 @@ async def test_submit_quiz_empty_answers(db: AsyncSession):
     user = await create_random_user(db)
     ex = await create_random_exercise(db)
 
-    quiz = Quiz(owner_id=user.id, exercises=[ex])
+    quiz = Quiz(owner_id=user.id, quiz_exercises=quiz_links([ex]))
     db.add(quiz)
     await db.flush()
 
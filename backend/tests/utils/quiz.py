@@ -1,6 +1,6 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.quiz import form_quiz
-from app.models import QuizPublic
+from app.models import Exercise, QuizExercise, QuizPublic
 from tests.utils.user import create_random_user
 
 from tests.utils.exercise import create_random_exercise
@@ -25,9 +25,22 @@ async def create_random_quiz(db: AsyncSession) -> QuizPublic:
 
     await db.flush()
 
-    quiz = await form_quiz(
+    quiz, _ = await form_quiz(
         length=5, tags=[tag], owner_id=user.id, title=title, session=db
     )
 
     await db.refresh(quiz)
     return quiz
+
+
+def quiz_links(exercises: list[Exercise]) -> list[QuizExercise]:
+    """
+    Utility function that links exercises to a quiz in the given order.
+    :param: exercises - exercises to link, positions follow the list order.
+    :returns: list[QuizExercise] - links to pass as Quiz.quiz_exercises.
+    """
+
+    return [
+        QuizExercise(exercise=exercise, position=position)
+        for position, exercise in enumerate(exercises)
+    ]